@@ -6,11 +6,16 @@ CAVE (https://pypi.org/project/caveclient/)
 NeuroglancerAnnotationUI (https://github.com/seung-lab/NeuroglancerAnnotationUI)
 """
 
+import copy
 import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
 from datajoint_plus.utils import wrap
 from cloudvolume import CloudVolume
 from caveclient import CAVEclient
 from .misc_utils import classproperty
+from .errors import VersionError
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,41 @@ m65_internal = 'minnie65_phase3_v1'
 m35_public = 'minnie35_public_v0'
 m35_internal = 'minnie35_phase3_v0'
 
+@lru_cache(maxsize=8)
+def _cave_client_cached(datastack, ver, caveclient_kws):
+    client = CAVEclient(datastack, **dict(caveclient_kws))
+    if ver is not None:
+        try:
+            client.materialize._version = int(ver)
+        except:
+            logging.exception('Could not set materialization version.')
+            raise VersionError('Could not set materialization version.')
+    return client
+
+
+def _cave_client(datastack, ver, caveclient_kws):
+    """
+    Returns a CAVEclient, reusing a previously constructed instance for the same datastack, version and kwargs.
+    Clients for the latest version (ver=None) are not cached so that new materializations are picked up.
+    Falls back to constructing a new client if the kwargs are not hashable.
+    """
+    if ver is None:
+        return _cave_client_cached.__wrapped__(datastack, ver, caveclient_kws)
+    key = tuple(sorted(caveclient_kws.items()))
+    try:
+        hash((ver, key))
+    except TypeError:
+        return _cave_client_cached.__wrapped__(datastack, ver, caveclient_kws)
+    return _cave_client_cached(datastack, ver, key)
+
+
+def reset_cave_cache():
+    """
+    Clears the cache of CAVEclient instances used by set_CAVEclient.
+    """
+    _cave_client_cached.cache_clear()
+
+
 def set_CAVEclient(datastack='m65_public', ver=None, caveclient_kws=None):
     """
     Sets CAVE client
@@ -48,7 +88,9 @@ def set_CAVEclient(datastack='m65_public', ver=None, caveclient_kws=None):
         datastack = datastack_mapping[datastack]
     
     try:
-        client = CAVEclient(datastack, **{} if caveclient_kws is None else caveclient_kws)
+        client = _cave_client(datastack, ver, {} if caveclient_kws is None else caveclient_kws)
+    except VersionError:
+        raise
     except Exception as e:
         if "invalid_token" in e.args[0]:
             logging.error('Valid token not found. Returning unauthorized client.')
@@ -70,13 +112,6 @@ def set_CAVEclient(datastack='m65_public', ver=None, caveclient_kws=None):
         else:
             logging.exception(e)
             return
-            
-    if ver is not None:
-        try:
-            client.materialize._version = int(ver)
-        except:
-            logging.exception('Could not set materialization version.')
-            raise Exception('Could not set materialization version.')
 
     try:
         logger.info(f'Instantiated CAVE client with datastack "{client.info.datastack_name}" and version: {client.materialize.version}. Most recent version: {client.materialize.most_recent_version()}')
@@ -108,7 +143,37 @@ class CAVEClient:
         return cls._client
 
 
-def get_stats_from_cv_path(cv_path, mip=None):
+_CV_CACHE_MAXSIZE = 32
+_cv_info = OrderedDict()
+
+
+@lru_cache(maxsize=_CV_CACHE_MAXSIZE)
+def _cv_cached(cv_path, mip=0, fill_missing=False, parallel=1, progress=False):
+    """
+    Returns a CloudVolume for cv_path, reusing a previously constructed instance 
+    for the same arguments. The info dict of the first CloudVolume built for a path 
+    is reused by later instances of that path with different arguments.
+    """
+    info = _cv_info.get(cv_path)
+    cv = CloudVolume(cv_path, use_https=True, progress=progress, mip=mip, fill_missing=fill_missing, parallel=parallel, info=None if info is None else copy.deepcopy(info))
+    if info is None:
+        _cv_info[cv_path] = copy.deepcopy(cv.info)
+        if len(_cv_info) > _CV_CACHE_MAXSIZE:
+            _cv_info.popitem(last=False)
+    else:
+        _cv_info.move_to_end(cv_path)
+    return cv
+
+
+def clear_cv_cache():
+    """
+    Clears the caches of CloudVolume instances and info used by get_stats_from_cv_path and get_stack_from_cv_path.
+    """
+    _cv_cached.cache_clear()
+    _cv_info.clear()
+
+
+def get_stats_from_cv_path(cv_path, mip=None, progress=False):
     """
     Given a cloudvolume path and optional mip (default = all), returns a dict with the following stats from cloudvolume:
         - res: resolution
@@ -119,6 +184,7 @@ def get_stats_from_cv_path(cv_path, mip=None):
     
     :param cv_path (str): CloudVolume path
     :param mip (int): the mip to get stats for. default is None.
+    :param progress (bool): if True, CloudVolume displays progress bars. default is False.
 
     :returns: 
         - If mip=None, list of dictionaries for all mips.
@@ -126,9 +192,10 @@ def get_stats_from_cv_path(cv_path, mip=None):
     """
     def get_stats_for_mip(mip):
         res = cv.mip_resolution(mip)
-        min_pt = cv.mip_bounds(mip).minpt
-        max_pt = cv.mip_bounds(mip).maxpt
-        ctr_pt = ((max_pt - min_pt) / 2) + min_pt
+        bounds = cv.mip_bounds(mip)
+        min_pt = bounds.minpt
+        max_pt = bounds.maxpt
+        ctr_pt = (min_pt + max_pt) * 0.5
         voxel_offset = cv.mip_voxel_offset(mip)
 
         return {
@@ -140,22 +207,27 @@ def get_stats_from_cv_path(cv_path, mip=None):
                 'voxel_offset' : voxel_offset
             }
 
-    cv = CloudVolume(cv_path, use_https=True, progress=True)
+    cv = _cv_cached(cv_path, progress=progress)
 
-    return get_stats_for_mip(mip) if mip is not None else [get_stats_for_mip(mip) for mip in list(cv.available_mips)]
+    return get_stats_for_mip(mip) if mip is not None else [get_stats_for_mip(mip) for mip in cv.available_mips]
 
 
-def get_stack_from_cv_path(cv_path, mip, seg_ids=None):
+def get_stack_from_cv_path(cv_path, mip, seg_ids=None, parallel=None, progress=False):
     """
     Given a cloudvolume path and mip returns the data stack from cloudvolume.
 
     :param cv_path (str): CloudVolume path
     :param mip (int): the mip to get stack for
     :param seg_ids (int): optional, the seg_ids to restrict to
+    :param parallel (int): number of processes CloudVolume uses to download chunks.
+        default (None) -> min(8, number of CPUs)
+    :param progress (bool): if True, CloudVolume displays progress bars. default is False.
 
     :returns: data stack
     """
-    cv = CloudVolume(cv_path, use_https=True, progress=True, fill_missing=True, mip=mip)
+    if parallel is None:
+        parallel = min(8, os.cpu_count() or 1)
+    cv = _cv_cached(cv_path, mip=mip, fill_missing=True, parallel=parallel, progress=progress)
     return cv.download(bbox=cv.bounds, segids=None if seg_ids is None else wrap(seg_ids)).squeeze()
 
 
@@ -1,35 +1,55 @@
 from datetime import datetime
-import pytz
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+
+@lru_cache(maxsize=None)
+def _get_zoneinfo(tz):
+    return ZoneInfo(tz)
+
+
+def _localize(timestamp, tz):
+    """
+    Attaches tz to a naive timestamp. Ambiguous or nonexistent local times (around DST transitions) 
+    resolve to standard time, matching pytz localize with is_dst=False.
+    """
+    for fold in (0, 1):
+        localized = timestamp.replace(tzinfo=tz, fold=fold)
+        if not localized.dst():
+            return localized
+    return timestamp.replace(tzinfo=tz)
+
 
 def timezone_converter(timestamp, source_tz, destination_tz, fmt=None):
     """
     Converts timestamp from a source timezone to a destination timezone. 
-    To see commonly used timezone options run: 
+    To see available timezone options run: 
     
-    ```from pytz import common_timezones```
+    ```from zoneinfo import available_timezones```
     
-    :param timestamp: (datetime.datetime) timestamp to convert
-    :param source_tz: (pytz.timezone) source timezone to convert 
-    :param destination_tz: (pytz.timezone) destination timezone
+    :param timestamp: (datetime.datetime) timestamp to convert. 
+        If timestamp is timezone aware, its tzinfo is used in place of source_tz. 
+        Ambiguous or nonexistent naive local times are interpreted as standard time.
+    :param source_tz: (str) source timezone to convert (e.g. 'UTC')
+    :param destination_tz: (str) destination timezone (e.g. 'US/Central')
     :param fmt: (str) optional - timestamp format to pass to strftime
     
     :returns: (datetime.datetime) converted timestamp
     """
-    dest_obj = pytz.timezone(destination_tz)
-    source_obj = pytz.timezone(source_tz).localize(timestamp.replace(tzinfo=None))
-    converted = dest_obj.normalize(source_obj.astimezone(dest_obj))
+    if timestamp.tzinfo is None:
+        timestamp = _localize(timestamp, _get_zoneinfo(source_tz))
+    converted = timestamp.astimezone(_get_zoneinfo(destination_tz))
     return converted if fmt is None else converted.strftime(fmt)
 
 
 def current_timestamp(tz='UTC', fmt=None):
     """
-    Returns current timestamp in desired timezone (per pytz nomenclature)
+    Returns current timestamp in desired timezone (per IANA tz database nomenclature)
 
-    ```from pytz import common_timezones```
+    ```from zoneinfo import available_timezones```
 
-    :param tz: (pytz.timezone) desired timezone
+    :param tz: (str) desired timezone
     :param fmt: (str) optional - timestamp format to pass to strftime
     :returns: (datetime.datetime) timestamp
     """
     return timezone_converter(datetime.utcnow(), 'UTC', tz, fmt=fmt)
-
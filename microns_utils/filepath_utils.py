@@ -7,6 +7,32 @@ import datetime
 import logging
 from .datetime_utils import timezone_converter
 
+def iter_matching_files(name, path):
+    """
+    Lazily yields files matching filename within path. 
+    Files in a directory are yielded before its subdirectories are searched.
+
+    :param name (str): file name to search
+    :param path (str): path to search within
+    :yields (pathlib.Path): matching paths to filenames
+    """
+    stack = [path]
+    while stack:
+        d = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        subdirs.append(e.path)
+                    elif e.name == name:
+                        yield Path(e.path)
+        except OSError:
+            pass
+        # reversed so subdirectories are popped in the same order os.walk visits them
+        stack.extend(reversed(subdirs))
+
+
 def find_all_matching_files(name, path):
     """
     Finds all files matching filename within path.
@@ -15,11 +41,7 @@ def find_all_matching_files(name, path):
     :param path (str): path to search within
     :returns (list): returns list of matching paths to filenames or empty list if no matches found. 
     """
-    result = []
-    for root, _, files in os.walk(path):
-        if name in files:
-            result.append(Path(os.path.join(root, name)))
-    return result
+    return list(iter_matching_files(name, path))
 
 
 def validate_filepath(filepath):
@@ -32,13 +54,13 @@ def get_file_modification_time(filepath, timezone, fmt=None):
     """
     Gets modification time of file.
     
-    :param filepath: (patlib.Path or str) path to file
-    :timezone: (str) desired timezone in pytz format (e.g. 'US/Central')
+    :param filepath: (os.PathLike or str) path to file
+    :timezone: (str) desired timezone in IANA format (e.g. 'US/Central')
     :fmt: optional (str) timestamp format to pass to strftime 
     
     :returns: datetime object
     """
-    ts = datetime.datetime.fromtimestamp(Path(filepath).stat().st_mtime, tz=datetime.timezone.utc)
+    ts = datetime.datetime.fromtimestamp(os.stat(filepath).st_mtime, tz=datetime.timezone.utc)
     return timezone_converter(ts, 'UTC', timezone, fmt=fmt)
 
 
@@ -54,7 +76,10 @@ def append_timestamp_to_filepath(filepath, timestamp, separator='__', with_suffi
     :param return_filepath: (bool) returns renamed filepath patlib.Path
     """
     filepath = Path(filepath)  
-    filepath_rn = filepath.with_name(f'{filepath.stem}{separator}{timestamp}').with_suffix(filepath.suffix if with_suffix is None else with_suffix)
+    suffix = filepath.suffix if with_suffix is None else with_suffix
+    if suffix and (not suffix.startswith('.') or suffix == '.'):
+        raise ValueError(f"Invalid suffix {suffix!r}")
+    filepath_rn = filepath.with_name(f'{filepath.stem}{separator}{timestamp}{suffix}')
     filepath.rename(filepath_rn)
     if verbose:
         logging.info(f'File renamed: {filepath_rn}')
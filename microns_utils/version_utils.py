@@ -4,20 +4,42 @@ Methods for checking installed and latest versions of microns packages.
 
 import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .misc_utils import wrap
 try:
     from importlib import metadata
 except ImportError:
     import importlib_metadata as metadata
 import logging
+import os
 import re
 import sys
-import json
+import time
 from pathlib import Path
-from .filepath_utils import find_all_matching_files
+from .filepath_utils import iter_matching_files
 
 logger = logging.getLogger(__name__)
 
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2)))
+_github_api_headers = {'Accept': 'application/vnd.github+json'}
+
+_SEMVER_RE = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$")
+_VERSION_LINE_RE = re.compile('__version__.*')
+
+_LATEST_VERSION_TTL = 300 # seconds
+_LATEST_VERSION_FAILURE_TTL = 30 # seconds
+_latest_version_cache = {}
+
+
+def _version_check_disabled():
+    """
+    Returns True if the environment variable MICRONS_DISABLE_VERSION_CHECK is set to a truthy value ("1", "true", "yes", "on").
+    """
+    return os.environ.get('MICRONS_DISABLE_VERSION_CHECK', '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
 def parse_version(text: str):
     """
     Extracts __version__ from raw text if __version__ follows semantic versioning (https://semver.org/).
@@ -27,11 +49,10 @@ def parse_version(text: str):
     :param text (str): the text containing the version.
     :returns (str): version if parsed successfully else ""
     """
-    semver = "^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-    version_search = re.search('__version__.*', text)
+    version_search = _VERSION_LINE_RE.search(text)
     text = version_search.group() if version_search is not None else text
     text = text.split('=')[1].strip(' "'" '") if len(text.split('='))>1 else text.strip(' "'" '")
-    parsed = re.search(semver, text)
+    parsed = _SEMVER_RE.match(text)
     return parsed.group() if parsed else ""
 
 
@@ -50,28 +71,39 @@ def check_latest_version_from_github(owner, repo, source, branch='main', path_to
     :param path_to_version_file (str): Path to version.py file from top of repo if source = "commit". 
     :param warn (bool): If true, warnings enabled.
     :returns (str): If successful, returns latest version, otherwise returns "".
+
+    Successful lookups are cached for _LATEST_VERSION_TTL seconds and failed lookups for _LATEST_VERSION_FAILURE_TTL seconds. 
+    Set the environment variable MICRONS_DISABLE_VERSION_CHECK to "1" or "true" to skip the check and return "".
     """
     latest = ""
+    if _version_check_disabled():
+        return latest
+
+    key = (owner, repo, source, branch, path_to_version_file)
+    cached = _latest_version_cache.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
     try:
         if source == 'commit':
             assert branch is not None, 'Provide branch if source = "commit".'
             assert path_to_version_file is not None, 'Provide path_to_version_file if source = "commit".'
-            f = requests.get(f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path_to_version_file}")
+            f = _session.get(f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path_to_version_file}", timeout=5)
             latest = parse_version(f.text)
             
         elif source == 'tag':
-            f = requests.get(f"https://api.github.com/repos/{owner}/{repo}/tags")
+            f = _session.get(f"https://api.github.com/repos/{owner}/{repo}/tags", params={'per_page': 1}, headers=_github_api_headers, timeout=5)
             if not f.ok:
                 logger.error(f'Could not check Github version because: "{f.reason}".')
-                return latest
-            latest = parse_version(json.loads(f.text)[0]['name'][1:])
+            else:
+                latest = parse_version(f.json()[0]['name'][1:])
             
         elif source == 'release':
-            f = requests.get(f"https://api.github.com/repos/{owner}/{repo}/releases")
+            f = _session.get(f"https://api.github.com/repos/{owner}/{repo}/releases", params={'per_page': 1}, headers=_github_api_headers, timeout=5)
             if not f.ok:
                 logger.error(f'Could not check Github version because: "{f.reason}".')
-                return latest
-            latest = parse_version(json.loads(f.text)[0]['tag_name'][1:])
+            else:
+                latest = parse_version(f.json()[0]['tag_name'][1:])
         
         else:
             raise ValueError(f'source: "{source}" not recognized. Options include: "commit", "tag", "release". ')
@@ -80,9 +112,18 @@ def check_latest_version_from_github(owner, repo, source, branch='main', path_to
             logger.warning('Failed to check latest version from Github.')
             traceback.print_exc()
 
+    _latest_version_cache[key] = (latest, time.monotonic() + (_LATEST_VERSION_TTL if latest else _LATEST_VERSION_FAILURE_TTL))
+
     return latest
 
 
+def clear_latest_version_cache():
+    """
+    Clears cached results of check_latest_version_from_github.
+    """
+    _latest_version_cache.clear()
+
+
 def latest_github_version_checker(owner, repo):
     """
     Returns a function to check latest version from github.
@@ -114,12 +155,12 @@ def check_package_version_from_distributions(package, warn=True):
     :param package (str): name of package:
     :returns (str):  If successful, returns version, otherwise returns "".
     """
-    version = [dist.version for dist in metadata.distributions() if dist.metadata["Name"] == package]
-    if not version:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
         if warn:
             logger.warning('Package not found in distributions.')
         return ''
-    return version[0]
 
 
 def check_package_version_from_sys_path(package, path_to_version_file, prefix='', warn=True):
@@ -134,7 +175,8 @@ def check_package_version_from_sys_path(package, path_to_version_file, prefix=''
     """
     err_base_str = f'Could not get version for package {package} because '
 
-    paths = [Path(p).joinpath(path_to_version_file) for p in sys.path if re.findall(Path(prefix).joinpath(package).as_posix()+'$', p)]
+    pat = re.compile(re.escape(Path(prefix).joinpath(package).as_posix())+'$')
+    paths = [Path(p).joinpath(path_to_version_file) for p in sys.path if pat.search(p)]
     
     if len(paths)>1:
         if warn:
@@ -148,16 +190,19 @@ def check_package_version_from_sys_path(package, path_to_version_file, prefix=''
         return ''
     
     else:
-        files = find_all_matching_files('version.py', paths[0])
+        # check the expected location before searching the tree
+        file = paths[0].joinpath('version.py')
+        if not file.is_file():
+            file = next(iter_matching_files('version.py', paths[0]), None)
 
-    if len(files) == 0:
+    if file is None:
         if warn:
             logger.warning(err_base_str + 'no version.py file was found.')
         return ''
 
     else:
-        with open(files[0]) as f:
-            lines = f.readlines()[0]
+        with open(file) as f:
+            lines = f.readline()
         
     return parse_version(lines)
 
@@ -190,7 +235,7 @@ def check_package_version(package, prefix='', check_if_latest=False, check_if_la
         # check if package version is latest
         latest = check_latest_version_from_github(**check_if_latest_kwargs)
 
-        if __version__ != latest:
+        if latest and __version__ != latest:
             if warn:
                 logger.warning(f'You are using {package} version {__version__}, which does not match the latest version on Github, {latest}.')
     
@@ -17,5 +17,6 @@ setup(
     author='Stelios Papadopoulos, Christos Papadopoulos',
     author_email='spapadop@bcm.edu, cpapadop@bcm.edu',
     packages=find_packages(exclude=[]),
+    python_requires='>=3.9',
     install_requires=requirements
 )
\ No newline at end of file